@@ -0,0 +1,234 @@
+"""Asynchronous low-level communication for PSLab.
+
+Unlike :class:`Handler <PSL.packet_handler.Handler>`, which blocks on every
+response, AsyncHandler decouples command submission from response collection.
+New commands can be written while earlier responses are still in flight,
+which overlaps the USB round trips on long command sequences such as bulk
+flash verification.
+
+Requires the optional pyserial-asyncio package.
+
+Example
+-------
+>>> import asyncio
+>>> from PSL.async_packet_handler import AsyncHandler
+>>> async def main():
+...     device = AsyncHandler()
+...     await device.connect()
+...     version = await device.get_version()
+...     device.disconnect()
+>>> asyncio.run(main())
+"""
+import asyncio
+import logging
+from typing import Union
+
+import serial
+import serial_asyncio
+from serial.tools import list_ports
+
+import PSL.commands_proto as CP
+from PSL.packet_handler import USB_PID, USB_VID, _STRUCTS, _VERSION_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+
+class _SerialProtocol(asyncio.Protocol):
+    """Feed received bytes to an inbox and wake any pending reader."""
+
+    def __init__(self):
+        self.transport = None
+        self.inbox = bytearray()
+        self._data_received = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._data_received = asyncio.Event()
+
+    def data_received(self, data):
+        self.inbox.extend(data)
+        self._data_received.set()
+
+    async def read(self, number_of_bytes: int) -> bytes:
+        """Return :number_of_bytes: bytes from the inbox, waiting as needed."""
+        while len(self.inbox) < number_of_bytes:
+            self._data_received.clear()
+            await self._data_received.wait()
+
+        data = bytes(self.inbox[:number_of_bytes])
+        del self.inbox[:number_of_bytes]
+        return data
+
+    async def readline(self) -> bytes:
+        """Return one newline-terminated line from the inbox."""
+        while b"\n" not in self.inbox:
+            self._data_received.clear()
+            await self._data_received.wait()
+
+        line, _, rest = bytes(self.inbox).partition(b"\n")
+        self.inbox[:] = rest
+        return line + b"\n"
+
+
+class AsyncHandler:
+    """Asynchronous counterpart to :class:`Handler <PSL.packet_handler.Handler>`.
+
+    Writes are queued on the transport without blocking; responses are
+    collected with coroutine methods. Awaiting a response only after queueing
+    subsequent commands pipelines the traffic.
+
+    Parameters
+    ----------
+    See :meth:`connect. <PSL.async_packet_handler.AsyncHandler.connect>`.
+    """
+
+    def __init__(
+        self,
+        port: str = None,
+        baudrate: int = 1000000,
+        timeout: float = 1.0,
+    ):
+        self.version = ""
+        self.timeout = timeout
+        self._port = port
+        self._baudrate = baudrate
+        self._transport = None
+        self._protocol = None
+
+    async def connect(self):
+        """Connect to PSLab.
+
+        Raises
+        ------
+        SerialException
+            If connection could not be established.
+        """
+        if self._port is not None:
+            candidates = [self._port]
+        else:
+            candidates = [
+                p.device
+                for p in list_ports.comports()
+                if p.vid == USB_VID and p.pid == USB_PID
+            ]
+
+        loop = asyncio.get_event_loop()
+
+        for device in candidates:
+            self._transport, self._protocol = (
+                await serial_asyncio.create_serial_connection(
+                    loop,
+                    _SerialProtocol,
+                    device,
+                    baudrate=self._baudrate,
+                )
+            )
+            try:
+                version = await self.get_version()
+            except asyncio.TimeoutError:
+                # Unresponsive device; close the port so a retry can open it,
+                # and move on to the next candidate.
+                self._transport.close()
+                continue
+
+            if version.startswith(_VERSION_PREFIXES):
+                self.version = version
+                self._port = device
+                logger.info(f"Connected to {self.version} on {device}.")
+                return
+
+            self._transport.close()
+
+        self.version = ""
+        raise serial.SerialException("Device not found.")
+
+    def disconnect(self):
+        """Disconnect from PSLab."""
+        if self._transport is not None:
+            self._transport.close()
+
+    async def get_version(self) -> str:
+        """Query PSLab for its version and return it as a decoded string.
+
+        Returns
+        -------
+        str
+            Version string.
+        """
+        self.send_byte(CP.COMMON)
+        self.send_byte(CP.GET_VERSION)
+        version = await asyncio.wait_for(self._protocol.readline(), self.timeout)
+        return version.decode("utf-8")
+
+    async def get_ack(self) -> int:
+        """Get response code from PSLab.
+
+        Returns
+        -------
+        int
+            Response code (see :meth:`Handler.get_ack
+            <PSL.packet_handler.Handler.get_ack>`).
+        """
+        response = await self.read(1)
+
+        try:
+            return CP.Byte.unpack(response)[0]
+        except Exception as e:
+            logger.error(e)
+            return 3
+
+    def _send(self, value: Union[bytes, int], size: int):
+        """Queue a value on the transport without waiting for transmission.
+
+        Parameters
+        ----------
+        value : bytes or int
+            Value to send to PSLab. Must fit in :size: bytes.
+        """
+        if isinstance(value, bytes):
+            packet = value
+        else:
+            packet = _STRUCTS[size].pack(value)
+
+        self._transport.write(packet)
+
+    def send_byte(self, value: Union[bytes, int]):
+        """Queue a one-byte value on the transport."""
+        self._send(value, 1)
+
+    def send_int(self, value: Union[bytes, int]):
+        """Queue a two-byte value on the transport."""
+        self._send(value, 2)
+
+    async def read(self, number_of_bytes: int) -> bytes:
+        """Read bytes from the serial inbox.
+
+        Parameters
+        ----------
+        number_of_bytes : int
+            Number of bytes to read.
+
+        Returns
+        -------
+        bytes
+            Bytes read from the inbox.
+        """
+        return await asyncio.wait_for(
+            self._protocol.read(number_of_bytes), self.timeout
+        )
+
+    async def _receive(self, size: int) -> int:
+        received = await self.read(size)
+        return _STRUCTS[size].unpack(received)[0]
+
+    async def get_byte(self) -> int:
+        """Read and unpack a one-byte value."""
+        return await self._receive(1)
+
+    async def get_int(self) -> int:
+        """Read and unpack a two-byte value."""
+        return await self._receive(2)
+
+    async def get_long(self) -> int:
+        """Read and unpack a four-byte value."""
+        return await self._receive(4)
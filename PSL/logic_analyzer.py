@@ -299,7 +299,8 @@ class LogicAnalyzer:
         self.clear_buffer(0, CP.MAX_SAMPLES)
         self._configure_trigger(channels)
         modes = [digital_channel.MODES[m] for m in modes]
-        start_time = time.time()
+        # monotonic is immune to wall-clock adjustments and cheaper than time.
+        start_time = time.monotonic()
 
         for e, c in enumerate(
             [self._channel_one_map, self._channel_two_map, "LA3", "LA4"][:channels]
@@ -325,7 +326,7 @@ class LogicAnalyzer:
             while progress < events:
                 timestamps = self.fetch_data()[:channels]
                 progress = min([len(t) for t in timestamps])
-                if time.time() - start_time >= timeout:
+                if time.monotonic() - start_time >= timeout:
                     break
                 if progress >= CP.MAX_SAMPLES // 4 - self._trimmed:
                     break
@@ -12,6 +12,7 @@ import os.path
 import platform
 import struct
 import time
+import weakref
 from functools import partial, update_wrapper
 from typing import List, Union
 
@@ -25,6 +26,22 @@ logger = logging.getLogger(__name__)
 USB_VID = 0x04D8
 USB_PID = 0x00DF
 
+_STRUCTS = {1: CP.Byte, 2: CP.ShortInt, 4: CP.Integer}
+
+_VERSION_PREFIXES = ("PSLab", "CSpark")
+
+
+def _safe_close(interface):
+    """Close :interface:, suppressing errors.
+
+    Runs as a finalizer when a Handler is garbage collected, possibly during
+    interpreter shutdown when closing cleanly is no longer guaranteed to work.
+    """
+    try:
+        interface.close()
+    except Exception:
+        pass
+
 
 class Handler:
     """Provides methods for communicating with the PSLab hardware.
@@ -45,7 +62,12 @@ class Handler:
         **kwargs,  # Backward compatibility
     ):
         self._check_udev()
-        self.burst_buffer = b""
+        self.burst_buffer = bytearray()
+        self._rx_buffer = b""
+        # Reusable pack_into target, so _send does not allocate per call.
+        self._scratch = bytearray(4)
+        self._scratch_view = memoryview(self._scratch)
+        self._finalizer = None
         self.load_burst = False
         self.input_queue_size = 0
         self.version = ""
@@ -98,6 +120,34 @@ class Handler:
                 )
                 raise OSError(e)
 
+    @property
+    def interface(self) -> serial.Serial:
+        """serial.Serial: Interface to the serial port."""
+        return self._interface
+
+    @interface.setter
+    def interface(self, value: serial.Serial):
+        self._interface = value
+        # Cache the bound methods; saves two attribute lookups per serial
+        # operation, which adds up over thousands of sends.
+        self._write = value.write
+        self._read = value.read
+        # Close the port when the Handler is garbage collected. A finalizer
+        # is reliable where __del__ is not, and does not hamper cyclic GC.
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        self._finalizer = weakref.finalize(self, _safe_close, value)
+
+    def __enter__(self):
+        """Connect to the PSLab if not already connected."""
+        if not self.interface.is_open:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect from the PSLab."""
+        self.disconnect()
+
     @staticmethod
     def _list_ports() -> List[str]:  # Promote to public?
         """Return a list of serial port names."""
@@ -138,20 +188,29 @@ class Handler:
 
         if self.interface.is_open:
             # User specified a port.
+            self._set_low_latency()
             version = self.get_version()
+            device_found = version.startswith(_VERSION_PREFIXES)
         else:
-            port_info_generator = list_ports.grep(f"{USB_VID:04x}:{USB_PID:04x}")
+            device_found = False
+            # A literal VID/PID comparison is cheaper than grepping every
+            # port's hwid string, and cannot match stray text in the hwid.
+            port_info_generator = (
+                p
+                for p in list_ports.comports()
+                if p.vid == USB_VID and p.pid == USB_PID
+            )
 
             for port_info in port_info_generator:
                 self.interface.port = port_info.device
                 self.interface.open()
+                self._set_low_latency()
                 version = self.get_version()
-                if any(expected in version for expected in ["PSLab", "CSpark"]):
+                device_found = version.startswith(_VERSION_PREFIXES)
+                if device_found:
                     break
-            else:
-                version = ""
 
-        if any(expected in version for expected in ["PSLab", "CSpark"]):
+        if device_found:
             self.version = version
             self.fd = self.interface  # Backward compatibility
             logger.info(f"Connected to {self.version} on {self.interface.port}.")
@@ -160,6 +219,19 @@ class Handler:
             self.version = ""
             raise serial.SerialException("Device not found.")
 
+    def _set_low_latency(self):
+        """Request low latency mode from the serial driver.
+
+        The default kernel latency timer (typically 16 ms on FTDI/CDC devices)
+        caps throughput for the short request/response transactions which make
+        up most of the traffic to the PSLab. ASYNC_LOW_LATENCY lowers the timer
+        to 1 ms. Not supported on every platform, in which case this is a no-op.
+        """
+        try:
+            self.interface.set_low_latency_mode(True)
+        except (NotImplementedError, ValueError, AttributeError, OSError):
+            pass
+
     def disconnect(self):
         """Disconnect from PSLab."""
         self.interface.close()
@@ -235,14 +307,10 @@ class Handler:
 
     @staticmethod
     def _get_integer_type(size: int) -> struct.Struct:
-        if size == 1:
-            return CP.Byte
-        elif size == 2:
-            return CP.ShortInt
-        elif size == 4:
-            return CP.Integer
-        else:
-            raise ValueError("size must be 1, 2, or 4.")
+        try:
+            return _STRUCTS[size]
+        except KeyError:
+            raise ValueError("size must be 1, 2, or 4.") from None
 
     def _send(self, value: Union[bytes, int], size: int):
         """Send a value to the PSLab.
@@ -254,15 +322,46 @@ class Handler:
         """
         if isinstance(value, bytes):
             packet = value
+        elif self.load_burst:
+            # extend() copies right away, so the scratch buffer can be reused
+            # without allocating a bytes object per queued command.
+            self._get_integer_type(size).pack_into(self._scratch, 0, value)
+            packet = self._scratch_view[:size]
         else:
-            packer = self._get_integer_type(size)
-            packet = packer.pack(value)
+            packet = self._get_integer_type(size).pack(value)
 
         if self.load_burst:
-            self.burst_buffer += packet
+            self.burst_buffer.extend(packet)
         else:
             self.write(packet)
 
+    def _send_packet(self, *parts: Union[bytes, tuple]):
+        """Assemble a command packet and send it with a single write.
+
+        Sending a multi-part command as one packet avoids the per-write
+        overhead of the serial stack, which can add a millisecond or more
+        per call on some platforms.
+
+        Parameters
+        ----------
+        *parts : bytes or tuple of (int, int)
+            Packet contents, either as raw bytes or as (value, size) tuples,
+            where size is the number of bytes (1, 2, or 4) used to pack value.
+        """
+        packet = bytearray()
+
+        for part in parts:
+            if isinstance(part, bytes):
+                packet += part
+            else:
+                value, size = part
+                packet += self._get_integer_type(size).pack(value)
+
+        if self.load_burst:
+            self.burst_buffer.extend(packet)
+        else:
+            self.write(bytes(packet))
+
     def _receive(self, size: int) -> int:
         """Read and unpack data from the serial port.
 
@@ -274,8 +373,8 @@ class Handler:
         received = self.read(size)
 
         if len(received) == size:
-            unpacker = self._get_integer_type(size)
-            retval = unpacker.unpack(received)[0]
+            # size is always 1, 2, or 4 here; look the unpacker up directly.
+            retval = _STRUCTS[size].unpack(received)[0]
         else:
             logger.error(f"Requested {size} bytes, got {len(received)}.")
             retval = -1  # raise an exception instead?
@@ -297,7 +396,12 @@ class Handler:
         bytes
             Bytes read from the serial port.
         """
-        data = self.interface.read(number_of_bytes)
+        data = self._rx_buffer[:number_of_bytes]
+        self._rx_buffer = self._rx_buffer[number_of_bytes:]
+
+        if len(data) < number_of_bytes:
+            data += self._read(number_of_bytes - len(data))
+
         self._write_log(data, "RX")
         return data
 
@@ -311,12 +415,12 @@ class Handler:
         data : int
             Bytes to write to the serial port.
         """
-        self.interface.write(data)
+        self._write(data)
         self._write_log(data, "TX")
 
     def _write_log(self, data: bytes, direction: str):
         if self._logging:
-            self._log += direction.encode() + data + "STOP".encode()
+            self._log += direction.encode() + bytes(data) + "STOP".encode()
 
     def wait_for_data(self, timeout: float = 0.2) -> bool:
         """Wait for :timeout: seconds or until there is data in the input buffer.
@@ -331,16 +435,25 @@ class Handler:
         bool
             True iff the input buffer is not empty.
         """
-        start_time = time.time()
+        # A blocking read with a temporary timeout lets the kernel wake us as
+        # soon as data arrives, instead of polling in_waiting every few
+        # milliseconds. Any byte read here is buffered and returned by the
+        # next call to read().
+        old_timeout = self.interface.timeout
+        self.interface.timeout = timeout
 
-        while time.time() - start_time < timeout:
-            if self.interface.in_waiting:
-                return True
-            time.sleep(0.02)
+        try:
+            data = self._read(1)
+        finally:
+            self.interface.timeout = old_timeout
+
+        if data:
+            self._rx_buffer += data
+            return True
 
         return False
 
-    def send_burst(self) -> List[int]:
+    def send_burst(self) -> bytes:
         """Transmit the commands stored in the burst_buffer.
 
         The burst_buffer and input buffer are both emptied.
@@ -358,17 +471,18 @@ class Handler:
 
         Returns
         -------
-        list
-            List of response codes
+        bytes
+            Response codes, one byte per queued command; iterating or indexing
+            yields them as ints
             (see :meth:`get_ack <PSL.packet_handler.Handler.get_ack>`).
         """
-        self.write(self.burst_buffer)
-        self.burst_buffer = b""
+        self.write(bytes(self.burst_buffer))
+        self.burst_buffer.clear()
         self.load_burst = False
         acks = self.read(self.input_queue_size)
         self.input_queue_size = 0
 
-        return list(acks)
+        return acks
 
 
 RECORDED_TRAFFIC = iter([])
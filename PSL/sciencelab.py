@@ -14,6 +14,12 @@ import PSL.packet_handler as packet_handler
 from PSL.logic_analyzer import LogicAnalyzer
 from PSL.oscilloscope import Oscilloscope
 
+# Flash command headers, prebuilt so the hot path need not concatenate them.
+_READ_FLASH_HEADER = CP.FLASH + CP.READ_FLASH
+_WRITE_FLASH_HEADER = CP.FLASH + CP.WRITE_FLASH
+_READ_BULK_FLASH_HEADER = CP.FLASH + CP.READ_BULK_FLASH
+_WRITE_BULK_FLASH_HEADER = CP.FLASH + CP.WRITE_BULK_FLASH
+
 
 def connect(**kwargs):
     '''
@@ -451,9 +457,9 @@ class ScienceLab():
         CT = 10
         CR = 1
         iterations = 0
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while (time.time() - start_time) < 1:
+        while (time.monotonic() - start_time) < 1:
             # self.__print__('vals',CR,',',CT)
             if CT > 65000:
                 self.__print__('CT too high')
@@ -581,10 +587,8 @@ class ScienceLab():
 
 		:return: a string of 16 characters read from the location
 		"""
-        self.H.__sendByte__(CP.FLASH)
-        self.H.__sendByte__(CP.READ_FLASH)
-        self.H.__sendByte__(page)  # send the page number. 20 pages with 2K bytes each
-        self.H.__sendByte__(location)  # send the location
+        # send the page number (20 pages with 2K bytes each) and the location
+        self.H._send_packet(_READ_FLASH_HEADER, (page, 1), (location, 1))
         ss = self.H.fd.read(16)
         self.H.__get_ack__()
         return ss
@@ -604,12 +608,9 @@ class ScienceLab():
 
 		:return: a string of 16 characters read from the location
 		"""
-        self.H.__sendByte__(CP.FLASH)
-        self.H.__sendByte__(CP.READ_BULK_FLASH)
         bytes_to_read = numbytes
         if numbytes % 2: bytes_to_read += 1  # bytes+1 . stuff is stored as integers (byte+byte) in the hardware
-        self.H.__sendInt__(bytes_to_read)
-        self.H.__sendByte__(page)
+        self.H._send_packet(_READ_BULK_FLASH_HEADER, (bytes_to_read, 2), (page, 1))
         ss = self.H.fd.read(int(bytes_to_read))
         self.H.__get_ack__()
         if numbytes % 2: return ss[:-1]  # Kill the extra character we read. Don't surprise the user with extra data
@@ -635,12 +636,13 @@ class ScienceLab():
 		================    ============================================================================================
 
 		"""
-        while (len(string_to_write) < 16): string_to_write += '.'
-        self.H.__sendByte__(CP.FLASH)
-        self.H.__sendByte__(CP.WRITE_FLASH)  # indicate a flash write coming through
-        self.H.__sendByte__(page)  # send the page number. 20 pages with 2K bytes each
-        self.H.__sendByte__(location)  # send the location
-        self.H.fd.write(string_to_write)
+        # pad to exactly 16 bytes; the old '.'-padding loop crashed on longer
+        # strings and passed str to the serial port, which Python 3 rejects
+        string_to_write = (string_to_write + '.' * 16)[:16].encode('ascii')
+        # send the page number (20 pages with 2K bytes each) and the location
+        self.H._send_packet(
+            _WRITE_FLASH_HEADER, (page, 1), (location, 1), string_to_write
+        )
         time.sleep(0.1)
         self.H.__get_ack__()
 
@@ -663,21 +665,19 @@ class ScienceLab():
 		================    ============================================================================================
 
 		"""
-        if (type(data) == str): data = [ord(a) for a in data]
-        if len(data) % 2 == 1: data.append(0)
-
-        self.H.__sendByte__(CP.FLASH)
-        self.H.__sendByte__(CP.WRITE_BULK_FLASH)  # indicate a flash write coming through
-        self.H.__sendInt__(len(data))  # send the length
-        self.H.__sendByte__(location)
-        for n in range(len(data)):
-            self.H.__sendByte__(data[n])
+        data = data.encode('ascii') if isinstance(data, str) else bytes(data)
+        data += b'\x00' * (-len(data) & 1)  # stored as 2-byte integers in the hardware
+
+        self.H._send_packet(
+            _WRITE_BULK_FLASH_HEADER, (len(data), 2), (location, 1), data
+        )
         self.H.__get_ack__()
 
-        # verification by readback
-        tmp = [ord(a) for a in self.read_bulk_flash(location, len(data))]
-        print('Verification done', tmp == data)
-        if tmp != data: raise Exception('Verification by readback failed')
+        # verification by readback. Compare as bytes instead of converting
+        # the page to a list of ints, which wastes kilobytes per page.
+        verified = self.read_bulk_flash(location, len(data)) == data
+        self.__print__('Verification done', verified)
+        if not verified: raise Exception('Verification by readback failed')
 
     # -------------------------------------------------------------------------------------------------------------------#
 
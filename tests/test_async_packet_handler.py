@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from serial import SerialException
+
+pytest.importorskip("serial_asyncio")
+
+import PSL.commands_proto as CP  # noqa: E402
+from PSL.async_packet_handler import AsyncHandler, _SerialProtocol  # noqa: E402
+
+VERSION = "PSLab vMOCK\n"
+PORT = "mock_port"
+
+
+def make_protocol(mocker):
+    protocol = _SerialProtocol()
+    protocol.connection_made(mocker.Mock())
+    return protocol
+
+
+def make_handler(mocker):
+    handler = AsyncHandler(port=PORT)
+    handler._protocol = make_protocol(mocker)
+    handler._transport = handler._protocol.transport
+    return handler
+
+
+def test_protocol_read(mocker):
+    async def scenario():
+        protocol = make_protocol(mocker)
+        protocol.data_received(b"abc")
+        return await protocol.read(2)
+
+    assert asyncio.run(scenario()) == b"ab"
+
+
+def test_protocol_readline(mocker):
+    async def scenario():
+        protocol = make_protocol(mocker)
+        protocol.data_received(VERSION.encode())
+        return await protocol.readline()
+
+    assert asyncio.run(scenario()) == VERSION.encode()
+
+
+def test_connect(mocker):
+    async def scenario():
+        handler = AsyncHandler(port=PORT)
+        protocol = make_protocol(mocker)
+
+        async def mock_connection(loop, factory, device, baudrate):
+            protocol.data_received(VERSION.encode())
+            return protocol.transport, protocol
+
+        mocker.patch(
+            "PSL.async_packet_handler.serial_asyncio.create_serial_connection",
+            mock_connection,
+        )
+        await handler.connect()
+        return handler.version
+
+    assert asyncio.run(scenario()) == VERSION
+
+
+def test_connect_unresponsive_device(mocker):
+    async def scenario():
+        handler = AsyncHandler(port=PORT)
+        handler.timeout = 0.01
+        protocol = make_protocol(mocker)
+
+        async def mock_connection(loop, factory, device, baudrate):
+            return protocol.transport, protocol
+
+        mocker.patch(
+            "PSL.async_packet_handler.serial_asyncio.create_serial_connection",
+            mock_connection,
+        )
+        with pytest.raises(SerialException):
+            await handler.connect()
+        return protocol.transport
+
+    transport = asyncio.run(scenario())
+    transport.close.assert_called()
+
+
+def test_send_byte(mocker):
+    async def scenario():
+        handler = make_handler(mocker)
+        handler.send_byte(0xFF)
+        return handler._transport.write.call_args
+
+    assert asyncio.run(scenario()) == mocker.call(CP.Byte.pack(0xFF))
+
+
+def test_get_ack(mocker):
+    async def scenario():
+        handler = make_handler(mocker)
+        handler._protocol.data_received(CP.Byte.pack(1))
+        return await handler.get_ack()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_receive(mocker):
+    async def scenario():
+        handler = make_handler(mocker)
+        handler._protocol.data_received(CP.ShortInt.pack(0x1234))
+        return await handler.get_int()
+
+    assert asyncio.run(scenario()) == 0x1234
+
+
+def test_pipelined_commands(mocker):
+    async def scenario():
+        handler = make_handler(mocker)
+        handler.send_byte(0x01)
+        handler.send_byte(0x02)
+        handler._protocol.data_received(b"\x01\x01")
+        return await asyncio.gather(handler.get_ack(), handler.get_ack())
+
+    assert asyncio.run(scenario()) == [1, 1]
@@ -3,7 +3,7 @@ from serial import SerialException
 from serial.tools.list_ports_common import ListPortInfo
 
 import PSL.commands_proto as CP
-from PSL.packet_handler import Handler
+from PSL.packet_handler import Handler, USB_VID, USB_PID
 
 VERSION = "PSLab vMOCK\n"
 PORT = "mock_port"
@@ -11,7 +11,10 @@ PORT = "mock_port"
 
 def mock_ListPortInfo(found=True):
     if found:
-        yield ListPortInfo(device=PORT)
+        port_info = ListPortInfo(device=PORT)
+        port_info.vid = USB_VID
+        port_info.pid = USB_PID
+        yield port_info
     else:
         return
 
@@ -36,7 +39,7 @@ def mock_list_ports(mocker):
 
 def test_connect_scan_port(mocker, mock_serial, mock_list_ports):
     mock_serial().is_open = False
-    mock_list_ports.grep.return_value = mock_ListPortInfo()
+    mock_list_ports.comports.return_value = mock_ListPortInfo()
     mocker.patch("PSL.packet_handler.Handler._check_udev")
     Handler()
     mock_serial().open.assert_called()
@@ -44,12 +47,23 @@ def test_connect_scan_port(mocker, mock_serial, mock_list_ports):
 
 def test_connect_scan_failure(mocker, mock_serial, mock_list_ports):
     mock_serial().is_open = False
-    mock_list_ports.grep.return_value = mock_ListPortInfo(found=False)
+    mock_list_ports.comports.return_value = mock_ListPortInfo(found=False)
     mocker.patch("PSL.packet_handler.Handler._check_udev")
     with pytest.raises(SerialException):
         Handler()
 
 
+def test_connect_low_latency(mock_serial, mock_handler):
+    mock_serial().set_low_latency_mode.assert_called_with(True)
+
+
+def test_context_manager(mocker, mock_serial):
+    mocker.patch("PSL.packet_handler.Handler._check_udev")
+    with Handler() as device:
+        assert device.version == VERSION
+    mock_serial().close.assert_called()
+
+
 def test_disconnect(mock_serial, mock_handler):
     mock_handler.disconnect()
     mock_serial().close.assert_called()
@@ -105,6 +119,17 @@ def test_send_byte_burst_mode(mock_serial, mock_handler):
     assert mock_handler.burst_buffer == CP.Byte.pack(0xFF)
 
 
+def test_send_packet(mock_serial, mock_handler):
+    mock_handler._send_packet(CP.FLASH, (0xAA, 1), (0x1234, 2))
+    mock_serial().write.assert_called_with(CP.FLASH + b"\xAA\x34\x12")
+
+
+def test_send_packet_burst_mode(mock_serial, mock_handler):
+    mock_handler.load_burst = True
+    mock_handler._send_packet(CP.FLASH, (0xAA, 1))
+    assert mock_handler.burst_buffer == CP.FLASH + b"\xAA"
+
+
 def test_receive(mock_serial, mock_handler):
     mock_serial().read.return_value = CP.Byte.pack(0xFF)
     r = mock_handler.get_byte()
@@ -120,15 +145,22 @@ def test_receive_failure(mock_serial, mock_handler):
 
 
 def test_wait_for_data(mock_serial, mock_handler):
-    mock_serial().in_waiting = True
+    mock_serial().read.return_value = b"\x01"
     assert mock_handler.wait_for_data()
 
 
 def test_wait_for_data_timeout(mock_serial, mock_handler):
-    mock_serial().in_waiting = False
+    mock_serial().read.return_value = b""
     assert not mock_handler.wait_for_data()
 
 
+def test_wait_for_data_buffers_data(mock_serial, mock_handler):
+    mock_serial().read.return_value = b"\x01"
+    mock_handler.wait_for_data()
+    mock_serial().read.return_value = b""
+    assert mock_handler.read(1) == b"\x01"
+
+
 def test_send_burst(mock_serial, mock_handler):
     mock_handler.load_burst = True
 
@@ -144,7 +176,7 @@ def test_send_burst(mock_serial, mock_handler):
     assert not mock_handler.load_burst
     assert mock_handler.burst_buffer == b""
     assert mock_handler.input_queue_size == 0
-    assert acks == [1, 1, 1]
+    assert acks == b"\x01\x01\x01"
 
 
 def test_get_integer_unsupported_size(mock_serial, mock_handler):